@@ -1,15 +1,43 @@
 from __future__ import annotations
 
 import os
-import random
-import re
-import string
-from typing import List, Optional, Dict, Callable
+import secrets
+import sys
+from itertools import chain
+from typing import List, Optional, Dict, Callable, Iterator
 
 from pacco.classes_interface import PackageManager, PackageRegistry, PackageBinary
 from pacco.clients import FileBasedClientAbstract
 
 
+_PARAMS_PREFIX = '__params'
+
+
+def _serialize_params(params: List[str]) -> str:
+    return '=='.join(chain((_PARAMS_PREFIX,), sorted(params)))
+
+
+def _serialize_assignment(assignment: Dict[str, str]) -> str:
+    if '' in assignment.values():
+        key = next(key for key, value in assignment.items() if value == '')
+        raise ValueError("assignment value for param {} cannot be an empty string".format(key))
+    return '=='.join('{}={}'.format(key, assignment[key]) for key in sorted(assignment))
+
+
+def _unserialize_assignment(dir_name: str) -> Dict[str, str]:
+    assignment = {}
+    for arg in dir_name.split('=='):
+        key, separator, value = arg.partition('=')
+        if not key or not separator:
+            raise ValueError("Invalid dir_name syntax {}".format(dir_name))
+        assignment[sys.intern(key)] = value
+    return assignment
+
+
+def _random_string(length: int) -> str:
+    return secrets.token_hex((length + 1) // 2)[:length].upper()
+
+
 class PackageManagerFileBased(PackageManager):
     """
     An implementation of the PackageManager interface
@@ -32,9 +60,21 @@ class PackageManagerFileBased(PackageManager):
         >>> pm.remove_package_registry('openssl')
         >>> pm.list_package_registries()
         ['boost']
+        >>> pm.get_package_registry('openssl')
+        Traceback (most recent call last):
+            ...
+        FileNotFoundError: The package registry openssl is not found
         >>> pm.get_package_registry('boost')
         PR[boost, os, target, type]
+        >>> PackageManagerFileBased(client).add_package_registry('zlib', ['os'])  # a second writer
+        >>> pm.get_package_registry('zlib')
+        PR[zlib, os]
+        >>> pm.add_package_registry('zlib', ['os', 'version'])
+        Traceback (most recent call last):
+            ...
+        FileExistsError: The package registry zlib is already found
     """
+    __slots__ = ()
 
     def __init__(self, client: FileBasedClientAbstract):
         if not isinstance(client, FileBasedClientAbstract):
@@ -48,16 +88,14 @@ class PackageManagerFileBased(PackageManager):
         self.client.rmdir(name)
 
     def add_package_registry(self, name: str, params: List[str]) -> None:
-        dirs = self.client.ls()
-        if name in dirs:
+        if self.client.exists(name):
             raise FileExistsError("The package registry {} is already found".format(name))
         self.client.mkdir(name)
         PackageRegistryFileBased(name, self.client.dispatch_subdir(name), params)
         return
 
     def get_package_registry(self, name: str) -> PackageRegistryFileBased:
-        dirs = self.client.ls()
-        if name not in dirs:
+        if not self.client.exists(name):
             raise FileNotFoundError("The package registry {} is not found".format(name))
         return PackageRegistryFileBased(name, self.client.dispatch_subdir(name))
 
@@ -89,6 +127,8 @@ class PackageRegistryFileBased(PackageRegistry):
         FileExistsError: such binary already exist
         >>> len(pr.list_package_binaries())
         1
+        >>> next(pr.iter_package_binaries()) == {'os':'osx', 'compiler':'clang', 'version':'1.0'}
+        True
         >>> pr.add_package_binary({'os':'linux', 'compiler':'gcc', 'version':'1.0'})
         >>> len(pr.list_package_binaries())
         2
@@ -111,8 +151,25 @@ class PackageRegistryFileBased(PackageRegistry):
         >>> pr.param_remove('compiler')
         >>> pr
         PR[openssl, os, stdlib, version]
+        >>> len(pr.list_package_binaries())
+        2
+        >>> other_pr = PackageManagerFileBased(client).get_package_registry('openssl')  # a second writer
+        >>> other_pr.add_package_binary({'os':'osx', 'stdlib':'c++11', 'version':'2.0'})
+        >>> pr.add_package_binary({'os':'osx', 'stdlib':'c++11', 'version':'2.0'})
+        Traceback (most recent call last):
+            ...
+        FileExistsError: such binary already exist
+        >>> binaries = [sorted(binary.items()) for binary in pr.list_package_binaries()]
+        >>> sorted(binaries) == sorted(sorted(binary.items()) for binary in other_pr.list_package_binaries())
+        True
+        >>> len(binaries)
+        3
+        >>> for binary in pr.iter_package_binaries():
+        ...     pr.remove_package_binary(binary)
+        >>> pr.list_package_binaries()
+        []
     """
-    __params_prefix = '__params'
+    __slots__ = ('__serialized_params', '__params_set')
 
     def __init__(self, name: str, client: FileBasedClientAbstract, params: Optional[List[str]] = None):
         if not isinstance(client, FileBasedClientAbstract):
@@ -125,105 +182,78 @@ class PackageRegistryFileBased(PackageRegistry):
                                     "means that the package registry is not properly set, you need to delete and "
                                     "add again")
         elif remote_params is not None:  # ignore the passed params and use the remote one
-            self.params = remote_params
+            self.params = [sys.intern(param) for param in remote_params]
+            self.__serialized_params = _serialize_params(self.params)
         else:
-            self.params = params
-            self.client.mkdir(self.__serialize_params(self.params))
+            self.params = [sys.intern(param) for param in params]
+            self.__serialized_params = _serialize_params(self.params)
+            self.client.mkdir(self.__serialized_params)
+        self.__params_set = frozenset(self.params)
 
     def __repr__(self):
         return "PR[{}, {}]".format(self.name, ', '.join(sorted(self.params)))
 
     def __get_remote_params(self) -> Optional[List[str]]:
-        params = None
-        dirs = self.client.ls()
-        for dir_name in dirs:
-            if PackageRegistryFileBased.__params_prefix in dir_name:
-                params = dir_name.split('==')[1:]
-        return params
-
-    @staticmethod
-    def __serialize_params(params: List[str]) -> str:
-        params = sorted(params)
-        return '=='.join([PackageRegistryFileBased.__params_prefix] + params)
-
-    @staticmethod
-    def __serialize_assignment(assignment: Dict[str, str]) -> str:
-        for key, value in assignment.items():
-            if len(value) == 0:
-                raise ValueError("assignment value for param {} cannot be an empty string".format(key))
-        sorted_assignment_tuple = sorted(assignment.items(), key=lambda x: x[0])
-        zipped_assignment = ['='.join(pair) for pair in sorted_assignment_tuple]
-        return '=='.join(zipped_assignment)
-
-    @staticmethod
-    def __unserialize_assignment(dir_name: str) -> Dict[str, str]:
-        if not re.match(r"((\w+=\w+)==)*(\w+=\w+)", dir_name):
-            raise ValueError("Invalid dir_name syntax {}".format(dir_name))
-        return {arg.split('=')[0]: arg.split('=')[1] for arg in dir_name.split('==')}
-
-    def __get_serialized_assignment_to_wrapper_mapping(self):
-        dir_names = self.client.ls()
-        dir_names.remove(self.__serialize_params(self.params))
+        for dir_name in self.client.ls():
+            if dir_name.startswith(_PARAMS_PREFIX):
+                return dir_name.split('==')[1:]
+        return None
 
+    def __get_serialized_assignment_to_wrapper_mapping(self) -> Dict[str, str]:
+        # listed once per public call and passed along, other writers may change the remote between calls
         mapping = {}
-        for dir_name in dir_names:
-            sub_dirs = self.client.dispatch_subdir(dir_name).ls()
-            if 'bin' in sub_dirs:
-                sub_dirs.remove('bin')
-            serialized_assignment = sub_dirs[0]
+        for dir_name, sub_dirs in self.client.ls_subdirs().items():
+            if dir_name == self.__serialized_params:
+                continue
+            serialized_assignment = next(sub_dir for sub_dir in sub_dirs if sub_dir != 'bin')
             mapping[serialized_assignment] = dir_name
-
         return mapping
 
-    def list_package_binaries(self) -> List[Dict[str, str]]:
-        return [PackageRegistryFileBased.__unserialize_assignment(serialized_assignment)
-                for serialized_assignment in self.__get_serialized_assignment_to_wrapper_mapping()]
+    def __validate_assignment_keys(self, assignment: Dict[str, str]) -> None:
+        if assignment.keys() != self.__params_set:
+            raise KeyError("wrong settings key: {} is not {}".format(sorted(assignment.keys()), sorted(self.params)))
+
+    def iter_package_binaries(self) -> Iterator[Dict[str, str]]:
+        for serialized_assignment in self.__get_serialized_assignment_to_wrapper_mapping():
+            yield _unserialize_assignment(serialized_assignment)
 
-    @staticmethod
-    def __random_string(length: int) -> str:
-        return ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
+    def list_package_binaries(self) -> List[Dict[str, str]]:
+        return list(self.iter_package_binaries())
 
     def add_package_binary(self, assignment: Dict[str, str]) -> None:
-        if set(assignment.keys()) != set(self.params):
-            raise KeyError("wrong settings key: {} is not {}".format(sorted(assignment.keys()),
-                                                                     sorted(self.params)))
+        self.__validate_assignment_keys(assignment)
 
-        serialized_assignment = PackageRegistryFileBased.__serialize_assignment(assignment)
+        serialized_assignment = _serialize_assignment(assignment)
         mapping = self.__get_serialized_assignment_to_wrapper_mapping()
         if serialized_assignment in mapping:
             raise FileExistsError("such binary already exist")
 
-        new_random_dir_name = PackageRegistryFileBased.__random_string(10)
-        if new_random_dir_name in mapping.values():
-            new_random_dir_name = PackageRegistryFileBased.__random_string(10)
+        existing_dir_names = set(mapping.values())
+        new_random_dir_name = _random_string(10)
+        while new_random_dir_name in existing_dir_names:
+            new_random_dir_name = _random_string(10)
 
         self.client.mkdir(new_random_dir_name)
         self.client.dispatch_subdir(new_random_dir_name).mkdir(serialized_assignment)
         return
 
     def remove_package_binary(self, assignment: Dict[str, str]):
-        self.client.rmdir(self.__get_serialized_assignment_to_wrapper_mapping()[
-                              PackageRegistryFileBased.__serialize_assignment(assignment)
-                          ])
+        serialized_assignment = _serialize_assignment(assignment)
+        mapping = self.__get_serialized_assignment_to_wrapper_mapping()
+        self.client.rmdir(mapping[serialized_assignment])
 
     def get_package_binary(self, assignment: Dict[str, str]) -> PackageBinaryFileBased:
-        serialized_assignment = PackageRegistryFileBased.__serialize_assignment(assignment)
-        if set(assignment.keys()) != set(self.params):
-            raise KeyError("wrong settings key: {} is not {}".format(sorted(assignment.keys()),
-                                                                     sorted(self.params)))
-        if serialized_assignment not in self.__get_serialized_assignment_to_wrapper_mapping():
+        self.__validate_assignment_keys(assignment)
+        wrapper_dir_name = self.__get_serialized_assignment_to_wrapper_mapping().get(_serialize_assignment(assignment))
+        if wrapper_dir_name is None:
             raise FileNotFoundError("such configuration does not exist")
-        return PackageBinaryFileBased(
-            self.client.dispatch_subdir(
-                self.__get_serialized_assignment_to_wrapper_mapping()[serialized_assignment]
-            )
-        )
-
-    def __rename_serialized_assignment(self, action: Callable[[Dict[str, str]], None]):
-        for serialized_assignment, dir_name in self.__get_serialized_assignment_to_wrapper_mapping().items():
-            assignment = PackageRegistryFileBased.__unserialize_assignment(serialized_assignment)
+        return PackageBinaryFileBased(self.client.dispatch_subdir(wrapper_dir_name), self.params)
+
+    def __rename_serialized_assignment(self, mapping: Dict[str, str], action: Callable[[Dict[str, str]], None]):
+        for serialized_assignment, dir_name in mapping.items():
+            assignment = _unserialize_assignment(serialized_assignment)
             action(assignment)
-            new_serialized_assignment = PackageRegistryFileBased.__serialize_assignment(assignment)
+            new_serialized_assignment = _serialize_assignment(assignment)
 
             sub_client = self.client.dispatch_subdir(dir_name)
             sub_client.mkdir(new_serialized_assignment)
@@ -236,40 +266,44 @@ class PackageRegistryFileBased(PackageRegistry):
         if name in self.params:
             raise ValueError("{} already in params".format(name))
 
-        self.client.rmdir(self.__serialize_params(self.params))
-        self.params.append(name)
-        self.client.mkdir(self.__serialize_params(self.params))
+        self.client.rmdir(self.__serialized_params)
+        self.params.append(sys.intern(name))
+        self.__serialized_params = _serialize_params(self.params)
+        self.__params_set = frozenset(self.params)
+        self.client.mkdir(self.__serialized_params)
 
-        self.__rename_serialized_assignment(lambda x: x.update({name: default_value}))
+        mapping = self.__get_serialized_assignment_to_wrapper_mapping()
+        self.__rename_serialized_assignment(mapping, lambda x: x.update({name: default_value}))
 
     def param_remove(self, name: str) -> None:
         if name not in self.params:
             raise ValueError("{} not in params".format(name))
 
         new_set_of_serialized_assignment = set()
-        for serialized_assignment, dir_name in self.__get_serialized_assignment_to_wrapper_mapping().items():
-            assignment = PackageRegistryFileBased.__unserialize_assignment(serialized_assignment)
+        mapping = self.__get_serialized_assignment_to_wrapper_mapping()
+        for serialized_assignment in mapping:
+            assignment = _unserialize_assignment(serialized_assignment)
             del assignment[name]
-            new_serialized_assignment = PackageRegistryFileBased.__serialize_assignment(assignment)
+            new_serialized_assignment = _serialize_assignment(assignment)
             if new_serialized_assignment in new_set_of_serialized_assignment:
                 raise NameError("Cannot remove parameter {} since it will cause "
                                 "two binary to have the same value".format(name))
             else:
                 new_set_of_serialized_assignment.add(new_serialized_assignment)
 
-        self.client.rmdir(self.__serialize_params(self.params))
+        self.client.rmdir(self.__serialized_params)
         self.params.remove(name)
-        self.client.mkdir(self.__serialize_params(self.params))
+        self.__serialized_params = _serialize_params(self.params)
+        self.__params_set = frozenset(self.params)
+        self.client.mkdir(self.__serialized_params)
 
-        self.__rename_serialized_assignment(lambda x: x.pop(name))
+        self.__rename_serialized_assignment(mapping, lambda x: x.pop(name))
 
     def reassign_binary(self, old_assignment: Dict[str, str], new_assignment: Dict[str, str]) -> None:
-        if set(new_assignment.keys()) != set(self.params):
-            raise KeyError("wrong settings key: {} is not {}".format(sorted(new_assignment.keys()),
-                                                                     sorted(self.params)))
+        self.__validate_assignment_keys(new_assignment)
 
-        serialized_old_assignment = PackageRegistryFileBased.__serialize_assignment(old_assignment)
-        serialized_new_assignment = PackageRegistryFileBased.__serialize_assignment(new_assignment)
+        serialized_old_assignment = _serialize_assignment(old_assignment)
+        serialized_new_assignment = _serialize_assignment(new_assignment)
         mapping = self.__get_serialized_assignment_to_wrapper_mapping()
         if serialized_old_assignment not in mapping:
             raise ValueError("there is no binary that match the assignment")
@@ -305,11 +339,12 @@ class PackageBinaryFileBased(PackageBinary):
         ['testfile', 'testfile2']
         >>> shutil.rmtree('testfolder')
     """
+    __slots__ = ()
 
-    def __init__(self, client: FileBasedClientAbstract):
+    def __init__(self, client: FileBasedClientAbstract, params: Optional[List[str]] = None):
         if not isinstance(client, FileBasedClientAbstract):
             raise TypeError("Must be using FileBasedClient")
-        super(PackageBinaryFileBased, self).__init__(client)
+        super(PackageBinaryFileBased, self).__init__(client, params)
 
     def __repr__(self):
         return "PackageBinaryObject"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from pacco.clients import ClientAbstract
 
@@ -10,6 +10,7 @@ class PackageManager:
     Represent the existence of the manager in a remote. This class is the interface class with the
     expected behavior defined below.
     """
+    __slots__ = ('client',)
 
     def __init__(self, client: ClientAbstract):
         self.client = client
@@ -63,6 +64,7 @@ class PackageRegistry:
     Represent the existence of a package (e.g. openssl) in the package manager.
     This class is the interface class with the expected behavior defined below.
     """
+    __slots__ = ('name', 'client', 'params')
 
     def __init__(self, name: str, client: ClientAbstract, params: Optional[List[str]] = None):
         self.name = name
@@ -78,6 +80,17 @@ class PackageRegistry:
         """
         raise NotImplementedError()
 
+    def iter_package_binaries(self) -> Iterator[Dict[str, str]]:
+        """
+        Iterate over the package binaries registered in this package registry. Prefer this over
+        ``list_package_binaries`` when only the first match is needed. Registries that can parse each assignment
+        only when it is reached should override this.
+
+        Returns:
+            iterator of the package binary assignment dictionaries
+        """
+        return iter(self.list_package_binaries())
+
     def add_package_binary(self, assignment: Dict[str, str]) -> None:
         """
         Add a new package binary to this registry. Note that this will only declare the existence of the binary
@@ -166,9 +179,11 @@ class PackageBinary:
         Represent the existence of a package (e.g. openssl) in the package manager
         This class is the interface class with the expected behavior defined below.
     """
+    __slots__ = ('client', 'params')
 
-    def __init__(self, client: ClientAbstract):
+    def __init__(self, client: ClientAbstract, params: Optional[List[str]] = None):
         self.client = client
+        self.params = params
 
     def download_content(self, download_dir_path: str) -> None:
         """
@@ -1,147 +1,150 @@
-import argparse
-import inspect
+from __future__ import annotations
+
 import re
-from typing import Callable, Dict
+from functools import lru_cache
+from types import FunctionType
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Optional
 
 from pacco import __version__ as client_version
 from pacco.cli.output_stream import OutputStream
 from pacco.remote_manager import RemoteManager, ALLOWED_REMOTE_TYPES
 
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+_SETTINGS_KEY_RE = re.compile(r"([(\w)-.]+,)*([(\w)-.]+),?")
+
+
+def _new_parser(prog: str) -> ArgumentParser:
+    import argparse  # deferred, --help and --version never parse arguments
+    return argparse.ArgumentParser(prog=prog)
 
-class CommandManager:
-    def __init__(self):
-        self.__out = OutputStream()
-        self.__rm = RemoteManager()
+
+class _Dispatcher:
+    """
+    Shared dispatching for the command groups, every public method defined by a subclass is a command, and
+    ``_PREFIX`` is the command line that leads to the group.
+    """
+    _PREFIX = "pacco"
+    _FLAGS = {
+        "-h": lambda self: self._show_help(),
+        "--help": lambda self: self._show_help(),
+    }
+    _commands: FrozenSet[str] = frozenset()
+    _help: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._commands = frozenset(name for name, member in vars(cls).items()
+                                  if isinstance(member, FunctionType) and not name.startswith('_'))
+        cls._help = None
+
+    def __init__(self, output: OutputStream):
+        self._out = output
 
     def run(self, *args):
         """
         Entry point for executing commands, dispatcher to class methods.
         """
         if not args:
-            self.__show_help()
+            self._show_help()
             return
         command = args[0]
-        remaining_args = args[1:]
-        commands = self.__get_commands()
-        if command not in commands:
-            if command in ["-h", "--help"]:
-                self.__show_help()
-                return
-            elif command in ["-v", "--version"]:
-                self.__out.writeln("Pacco version {}".format(client_version))
-                return
-            self.__out.writeln("'pacco {}' is an invalid command. See 'pacco --help'.".format(command), error=True)
-            return
-        method = commands[command]
-        method(*remaining_args)
+        if command in self._FLAGS:
+            self._FLAGS[command](self)
+        elif command in self._commands:
+            getattr(self, command)(*args[1:])
+        else:
+            self._out.writeln("'{0} {1}' is an invalid command. See '{0} --help'.".format(self._PREFIX, command),
+                              error=True)
+
+    @classmethod
+    def _get_help(cls) -> str:
+        if cls._help is None:
+            commands = sorted(cls._commands)
+            fmt = '  {} %-{}s'.format(cls._PREFIX, max(map(len, commands)) + 1)
+            lines = []
+            for name in commands:
+                doc = vars(cls)[name].__doc__
+                lines.append(fmt % name + (' '.join(doc.split()) if doc else ""))
+            lines.append("")
+            lines.append("{} commands. Type '{} <command> -h' for help".format(cls._PREFIX.capitalize(), cls._PREFIX))
+            cls._help = '\n'.join(lines)
+        return cls._help
+
+    def _show_help(self):
+        self._out.writeln(self._get_help())
+
+
+class CommandManager(_Dispatcher):
+    _FLAGS = {
+        **_Dispatcher._FLAGS,
+        "-v": lambda self: self.__show_version(),
+        "--version": lambda self: self.__show_version(),
+    }
 
-    def __get_commands(self) -> Dict[str, Callable]:
-        result = {}
-        for method_name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if not method_name.startswith('_') and method_name not in ["run"]:
-                result[method_name] = method
-        return result
+    def __init__(self):
+        super(CommandManager, self).__init__(OutputStream())
+        self.__rm: Optional[RemoteManager] = None  # loaded on first use, help/version does not need the config
+        self.__remote = Remote(self._out, self.__get_remote_manager)
+        self.__registry = Registry(self._out, self.__get_remote_manager)
+        self.__binary = Binary(self._out, self.__get_remote_manager)
 
-    def __show_help(self):
-        commands = self.__get_commands()
-        max_len = max((len("pacco {}".format(c)) for c in commands)) + 1
-        fmt = '  %-{}s'.format(max_len)
-        for name in commands:
-            appended_name = "pacco {}".format(name)
-            print(fmt % appended_name, end="")
-            if commands[name].__doc__:
-                docstring_lines = commands[name].__doc__.split('\n')
-                data = []
-                for line in docstring_lines:
-                    line = line.strip()
-                    data.append(line)
-                self.__out.writeln(' '.join(data))
-            else:
-                self.__out.writeln("")  # Empty docs
-        self.__out.writeln("")
-        self.__out.writeln("Pacco commands. Type 'pacco <command> -h' for help")
+    def __show_version(self):
+        self._out.writeln("Pacco version {}".format(client_version))
+
+    def __get_remote_manager(self) -> RemoteManager:
+        if self.__rm is None:
+            self.__rm = RemoteManager()
+        return self.__rm
 
     def remote(self, *args: str):
-        Remote(self.__out, self.__rm).run(*args)
+        self.__remote.run(*args)
 
     def registry(self, *args: str):
-        Registry(self.__out, self.__rm).run(*args)
+        self.__registry.run(*args)
 
     def binary(self, *args: str):
-        Binary(self.__out, self.__rm).run(*args)
-
+        self.__binary.run(*args)
 
-class Remote:
-    def __init__(self, output: OutputStream, remote_manager: RemoteManager):
-        self.__out = output
-        self.__rm = remote_manager
 
-    def run(self, *args):
-        """
-        Entry point for executing commands, dispatcher to class methods.
-        """
-        if not args:
-            self.__show_help()
-            return
-        command = args[0]
-        remaining_args = args[1:]
-        commands = self.__get_commands()
-        if command not in commands:
-            if command in ["-h", "--help"]:
-                self.__show_help()
-                return
-            self.__out.writeln("'pacco remote {}' is an invalid command. See 'pacco remote --help'.".format(command),
-                               error=True)
-            return
-        method = commands[command]
-        method(*remaining_args)
+class Remote(_Dispatcher):
+    _PREFIX = "pacco remote"
 
-    def __get_commands(self) -> Dict[str, Callable]:
-        result = {}
-        for method_name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if not method_name.startswith('_') and method_name not in ["run"]:
-                result[method_name] = method
-        return result
+    def __init__(self, output: OutputStream, remote_manager: Callable[[], RemoteManager]):
+        super(Remote, self).__init__(output)
+        self.__remote_manager = remote_manager
 
-    def __show_help(self):
-        commands = self.__get_commands()
-        max_len = max((len("pacco remote {}".format(c)) for c in commands)) + 1
-        fmt = '  %-{}s'.format(max_len)
-        for name in commands:
-            appended_name = "pacco remote {}".format(name)
-            print(fmt % appended_name, end="")
-            if commands[name].__doc__:
-                docstring_lines = commands[name].__doc__.split('\n')
-                data = []
-                for line in docstring_lines:
-                    line = line.strip()
-                    data.append(line)
-                self.__out.writeln(' '.join(data))
-            else:
-                self.__out.writeln("")  # Empty docs
-        self.__out.writeln("")
-        self.__out.writeln("Pacco remote commands. Type 'pacco remote <command> -h' for help")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __list_parser() -> ArgumentParser:
+        return _new_parser("pacco remote list")
 
     def list(self, *args):
         """
         List existing remotes.
         """
-        parser = argparse.ArgumentParser(prog="pacco remote list")
-        parser.parse_args(args)
-        remotes = self.__rm.list_remote()
-        self.__out.writeln(remotes)
+        if args:  # nothing to parse, only -h or a usage error reach argparse
+            Remote.__list_parser().parse_args(args)
+        remotes = self.__remote_manager().list_remote()
+        self._out.writeln(remotes)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __add_parser() -> ArgumentParser:
+        parser = _new_parser("pacco remote add")
+        parser.add_argument("name", help="remote name")
+        parser.add_argument("type", help="remote type", choices=ALLOWED_REMOTE_TYPES)
+        return parser
 
     def add(self, *args):
         """
         Add a remote.
         """
-        parser = argparse.ArgumentParser(prog="pacco remote add")
-        parser.add_argument("name", help="remote name")
-        parser.add_argument("type", help="remote type", choices=ALLOWED_REMOTE_TYPES)
-        parsed_args = parser.parse_args(args)
+        parsed_args = Remote.__add_parser().parse_args(args)
         if parsed_args.type == "local":
             path = input("Path (if empty, ~/.pacco/ will be used): ")
-            self.__rm.add_remote(parsed_args.name, {
+            self.__remote_manager().add_remote(parsed_args.name, {
                 "remote_type": "local",
                 "path": path
             })
@@ -150,306 +153,293 @@ class Remote:
             username = input("Username: ")
             from getpass import getpass
             password = getpass()
-            self.__rm.add_remote(parsed_args.name, {
+            self.__remote_manager().add_remote(parsed_args.name, {
                 "remote_type": "nexus_site",
                 "url": url,
                 "username": username,
                 "password": password
             })
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __remove_parser() -> ArgumentParser:
+        parser = _new_parser("pacco remote remove")
+        parser.add_argument("name", help="remote name")
+        return parser
+
     def remove(self, *args):
         """
         Remove a remote.
         """
-        parser = argparse.ArgumentParser(prog="pacco remote remove")
-        parser.add_argument("name", help="remote name")
-        parsed_args = parser.parse_args(args)
-        self.__rm.remove_remote(parsed_args.name)
+        parsed_args = Remote.__remove_parser().parse_args(args)
+        self.__remote_manager().remove_remote(parsed_args.name)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __set_default_parser() -> ArgumentParser:
+        parser = _new_parser("pacco remote set_default")
+        parser.add_argument("name", nargs="*", help="remote name")
+        return parser
 
     def set_default(self, *args):
         """
         Set default remote(s).
         """
-        parser = argparse.ArgumentParser(prog="pacco remote set_default")
-        parser.add_argument("name", nargs="*", help="remote name")
-        parsed_args = parser.parse_args(args)
-        self.__rm.set_default(parsed_args.name)
+        parsed_args = Remote.__set_default_parser().parse_args(args)
+        self.__remote_manager().set_default(parsed_args.name)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __list_default_parser() -> ArgumentParser:
+        return _new_parser("pacco remote list_default")
 
     def list_default(self, *args):
         """
         List default remote(s).
         """
-        parser = argparse.ArgumentParser(prog="pacco remote list_default")
-        parser.parse_args(args)
-        default_remotes = self.__rm.get_default()
-        self.__out.writeln(default_remotes)
+        if args:  # nothing to parse, only -h or a usage error reach argparse
+            Remote.__list_default_parser().parse_args(args)
+        default_remotes = self.__remote_manager().get_default()
+        self._out.writeln(default_remotes)
 
 
-class Registry:
-    def __init__(self, output: OutputStream, remote_manager: RemoteManager):
-        self.__out = output
-        self.__rm = remote_manager
+class Registry(_Dispatcher):
+    _PREFIX = "pacco registry"
 
-    def run(self, *args):
-        """
-        Entry point for executing commands, dispatcher to class methods.
-        """
-        if not args:
-            self.__show_help()
-            return
-        command = args[0]
-        remaining_args = args[1:]
-        commands = self.__get_commands()
-        if command not in commands:
-            if command in ["-h", "--help"]:
-                self.__show_help()
-                return
-            self.__out.writeln(
-                "'pacco registry {}' is an invalid command. See 'pacco registry --help'.".format(command),
-                error=True)
-            return
-        method = commands[command]
-        method(*remaining_args)
+    def __init__(self, output: OutputStream, remote_manager: Callable[[], RemoteManager]):
+        super(Registry, self).__init__(output)
+        self.__remote_manager = remote_manager
 
-    def __get_commands(self) -> Dict[str, Callable]:
-        result = {}
-        for method_name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if not method_name.startswith('_') and method_name not in ["run"]:
-                result[method_name] = method
-        return result
-
-    def __show_help(self):
-        commands = self.__get_commands()
-        max_len = max((len("pacco registry {}".format(c)) for c in commands)) + 1
-        fmt = '  %-{}s'.format(max_len)
-        for name in commands:
-            appended_name = "pacco registry {}".format(name)
-            print(fmt % appended_name, end="")
-            if commands[name].__doc__:
-                docstring_lines = commands[name].__doc__.split('\n')
-                data = []
-                for line in docstring_lines:
-                    line = line.strip()
-                    data.append(line)
-                self.__out.writeln(' '.join(data))
-            else:
-                self.__out.writeln("")  # Empty docs
-        self.__out.writeln("")
-        self.__out.writeln("Pacco registry commands. Type 'pacco registry <command> -h' for help")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __list_parser() -> ArgumentParser:
+        parser = _new_parser("pacco registry list")
+        parser.add_argument("remote", help="remote name")
+        return parser
 
     def list(self, *args):
         """
         List registries of a remote.
         """
-        parser = argparse.ArgumentParser(prog="pacco registry list")
+        parsed_args = Registry.__list_parser().parse_args(args)
+        pm = self.__remote_manager().get_remote(parsed_args.remote)
+        self._out.writeln(pm.list_package_registries())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __add_parser() -> ArgumentParser:
+        parser = _new_parser("pacco registry add")
         parser.add_argument("remote", help="remote name")
-        parsed_args = parser.parse_args(args)
-        pm = self.__rm.get_remote(parsed_args.remote)
-        self.__out.writeln(pm.list_package_registries())
+        parser.add_argument("name", help="registry name")
+        parser.add_argument("settings", help="settings key (e.g. os,version,obfuscation)")
+        return parser
 
     def add(self, *args):
         """
         Add registry to remote.
         """
-        parser = argparse.ArgumentParser(prog="pacco registry add")
-        parser.add_argument("remote", help="remote name")
-        parser.add_argument("name", help="registry name")
-        parser.add_argument("settings", help="settings key (e.g. os,version,obfuscation)")
-        parsed_args = parser.parse_args(args)
-        if not re.match(r"([(\w)-.]+,)*([(\w)-.]+),?", parsed_args.settings):
+        parsed_args = Registry.__add_parser().parse_args(args)
+        if not _SETTINGS_KEY_RE.match(parsed_args.settings):
             raise ValueError("Settings must be in the form of ([(\\w)-.]+,)*([(\\w)-.]+),?")
-        pm = self.__rm.get_remote(parsed_args.remote)
+        pm = self.__remote_manager().get_remote(parsed_args.remote)
         pm.add_package_registry(parsed_args.name, parsed_args.settings.split(","))
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __remove_parser() -> ArgumentParser:
+        parser = _new_parser("pacco registry remove")
+        parser.add_argument("remote", help="remote name")
+        parser.add_argument("name", help="registry name")
+        return parser
+
     def remove(self, *args):
         """
         Remove a registry from a specific remote.
         """
-        parser = argparse.ArgumentParser(prog="pacco registry remove")
+        parsed_args = Registry.__remove_parser().parse_args(args)
+        pm = self.__remote_manager().get_remote(parsed_args.remote)
+        pm.remove_package_registry(parsed_args.name)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __binaries_parser() -> ArgumentParser:
+        parser = _new_parser("pacco registry binaries")
         parser.add_argument("remote", help="remote name")
         parser.add_argument("name", help="registry name")
-        parsed_args = parser.parse_args(args)
-        pm = self.__rm.get_remote(parsed_args.remote)
-        pm.remove_package_registry(parsed_args.name)
+        return parser
 
     def binaries(self, *args):
         """
         List binaries of a registry from a specific remote.
         """
-        parser = argparse.ArgumentParser(prog="pacco registry binaries")
+        parsed_args = Registry.__binaries_parser().parse_args(args)
+        pm = self.__remote_manager().get_remote(parsed_args.remote)
+        pr = pm.get_package_registry(parsed_args.name)
+        self._out.writeln(pr.list_package_binaries())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __param_list_parser() -> ArgumentParser:
+        parser = _new_parser("pacco registry param_list")
         parser.add_argument("remote", help="remote name")
         parser.add_argument("name", help="registry name")
-        parsed_args = parser.parse_args(args)
-        pm = self.__rm.get_remote(parsed_args.remote)
-        pr = pm.get_package_registry(parsed_args.name)
-        self.__out.writeln(pr.list_package_binaries())
+        return parser
 
     def param_list(self, *args):
         """
         List params of a registry.
         """
-        parser = argparse.ArgumentParser(prog="pacco registry param_list")
-        parser.add_argument("remote", help="remote name")
-        parser.add_argument("name", help="registry name")
-
-        parsed_args = parser.parse_args(args)
-        pm = self.__rm.get_remote(parsed_args.remote)
+        parsed_args = Registry.__param_list_parser().parse_args(args)
+        pm = self.__remote_manager().get_remote(parsed_args.remote)
         pr = pm.get_package_registry(parsed_args.name)
-        self.__out.writeln(pr.param_list())
+        self._out.writeln(pr.param_list())
 
-    def param_add(self, *args):
-        """
-        Add new parameter with default value to the binaries.
-        """
-        parser = argparse.ArgumentParser(prog="pacco registry param_add")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __param_add_parser() -> ArgumentParser:
+        parser = _new_parser("pacco registry param_add")
         parser.add_argument("remote", help="remote name")
         parser.add_argument("name", help="registry name")
         parser.add_argument("param_name", help="the new param name to be added")
         parser.add_argument("default_value", help="the default_value assigned to the new param")
+        return parser
 
-        parsed_args = parser.parse_args(args)
-        pm = self.__rm.get_remote(parsed_args.remote)
+    def param_add(self, *args):
+        """
+        Add new parameter with default value to the binaries.
+        """
+        parsed_args = Registry.__param_add_parser().parse_args(args)
+        pm = self.__remote_manager().get_remote(parsed_args.remote)
         pr = pm.get_package_registry(parsed_args.name)
         pr.param_add(parsed_args.param_name, parsed_args.default_value)
 
-    def param_remove(self, *args):
-        """
-        Remove an existing parameter from all binaries.
-        """
-        parser = argparse.ArgumentParser(prog="pacco registry remove_param")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __param_remove_parser() -> ArgumentParser:
+        parser = _new_parser("pacco registry remove_param")
         parser.add_argument("remote", help="remote name")
         parser.add_argument("name", help="registry name")
         parser.add_argument("param_name", help="the param name to be removed")
+        return parser
 
-        parsed_args = parser.parse_args(args)
-        pm = self.__rm.get_remote(parsed_args.remote)
+    def param_remove(self, *args):
+        """
+        Remove an existing parameter from all binaries.
+        """
+        parsed_args = Registry.__param_remove_parser().parse_args(args)
+        pm = self.__remote_manager().get_remote(parsed_args.remote)
         pr = pm.get_package_registry(parsed_args.name)
         pr.param_remove(parsed_args.param_name)
 
 
-class Binary:
-    def __init__(self, output, remote_manager: RemoteManager):
-        self.__out = output
-        self.__rm = remote_manager
+class Binary(_Dispatcher):
+    _PREFIX = "pacco binary"
 
-    def run(self, *args):
-        """
-        Entry point for executing commands, dispatcher to class methods.
-        """
-        if not args:
-            self.__show_help()
-            return
-        command = args[0]
-        remaining_args = args[1:]
-        commands = self.__get_commands()
-        if command not in commands:
-            if command in ["-h", "--help"]:
-                self.__show_help()
-                return
-            self.__out.writeln(
-                "'pacco binary {}' is an invalid command. See 'pacco binary --help'.".format(command),
-                error=True)
-            return
-        method = commands[command]
-        method(*remaining_args)
+    def __init__(self, output, remote_manager: Callable[[], RemoteManager]):
+        super(Binary, self).__init__(output)
+        self.__remote_manager = remote_manager
 
-    def __get_commands(self) -> Dict[str, Callable]:
+    @staticmethod
+    def __parse_settings_args(settings_args: str) -> Dict[str, str]:
         result = {}
-        for method_name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if not method_name.startswith('_') and method_name not in ["run"]:
-                result[method_name] = method
+        for token in settings_args.split(','):
+            if not token:
+                continue
+            key, sep, value = token.partition('=')
+            if not sep or not key or not value:
+                raise ValueError("The settings configuration must be in the form of key=value,key=value,..., "
+                                 "got {}".format(settings_args))
+            result[key] = value
+        if not result:
+            raise ValueError("The settings configuration must be in the form of key=value,key=value,..., "
+                             "got {}".format(settings_args))
         return result
 
-    def __show_help(self):
-        commands = self.__get_commands()
-        max_len = max((len("pacco binary {}".format(c)) for c in commands)) + 1
-        fmt = '  %-{}s'.format(max_len)
-        for name in commands:
-            appended_name = "pacco binary {}".format(name)
-            print(fmt % appended_name, end="")
-            if commands[name].__doc__:
-                docstring_lines = commands[name].__doc__.split('\n')
-                data = []
-                for line in docstring_lines:
-                    line = line.strip()
-                    data.append(line)
-                self.__out.writeln(' '.join(data))
-            else:
-                self.__out.writeln("")  # Empty docs
-        self.__out.writeln("")
-        self.__out.writeln("Pacco binary commands. Type 'pacco binary <command> -h' for help")
-
     @staticmethod
-    def __parse_settings_args(settings_args: str) -> Dict[str, str]:
-        if not re.match(r"([\w\-.]+=[\w\-.]+,)*([\w\-.]+=[\w\-.]+),?", settings_args):
-            raise ValueError("The settings configuration must match ([\\w-.]+=[\\w-.]+,)*([\\w-.]+=[\\w-.]+),?")
-        return {token.split('=')[0]: token.split('=')[1] for token in settings_args.split(',')}
-
-    def download(self, *args):
-        parser = argparse.ArgumentParser(prog="pacco binary download")
+    @lru_cache(maxsize=None)
+    def __download_parser() -> ArgumentParser:
+        parser = _new_parser("pacco binary download")
         parser.add_argument("remote_name", help="remote name")
         parser.add_argument("registry_name", help="registry name")
         parser.add_argument("dir_path", help="download path")
         parser.add_argument("settings", help="settings for the specified registry "
                                              "(e.g. os=linux,version=2.1.0,type=debug")
-        parsed_args = parser.parse_args(args)
+        return parser
+
+    def download(self, *args):
+        parsed_args = Binary.__download_parser().parse_args(args)
 
         settings_dict = Binary.__parse_settings_args(parsed_args.settings)
         if parsed_args.remote_name == 'default':
-            self.__rm.default_download(parsed_args.registry_name, settings_dict, parsed_args.dir_path)
-        pm = self.__rm.get_remote(parsed_args.remote_name)
+            self.__remote_manager().default_download(parsed_args.registry_name, settings_dict, parsed_args.dir_path)
+            return
+        pm = self.__remote_manager().get_remote(parsed_args.remote_name)
         pr = pm.get_package_registry(parsed_args.registry_name)
         pb = pr.get_package_binary(settings_dict)
         pb.download_content(parsed_args.dir_path)
 
-    def upload(self, *args):
-        parser = argparse.ArgumentParser(prog="pacco binary upload")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __upload_parser() -> ArgumentParser:
+        parser = _new_parser("pacco binary upload")
         parser.add_argument("remote_name", help="remote name")
         parser.add_argument("registry_name", help="registry name")
         parser.add_argument("dir_path", help="directory to be uploaded")
         parser.add_argument("settings", help="settings for the specified registry "
                                              "(e.g. os=linux,version=2.1.0,type=debug")
-        parsed_args = parser.parse_args(args)
+        return parser
+
+    def upload(self, *args):
+        parsed_args = Binary.__upload_parser().parse_args(args)
 
         assignment = Binary.__parse_settings_args(parsed_args.settings)
-        pm = self.__rm.get_remote(parsed_args.remote_name)
+        pm = self.__remote_manager().get_remote(parsed_args.remote_name)
         pr = pm.get_package_registry(parsed_args.registry_name)
         try:
-            pr.get_package_binary(assignment)
+            pb = pr.get_package_binary(assignment)
         except FileNotFoundError:
             pr.add_package_binary(assignment)
-        else:
-            self.__out.writeln("WARNING: Existing binary found, overwriting")
-        finally:
             pb = pr.get_package_binary(assignment)
-            pb.upload_content(parsed_args.dir_path)
+        else:
+            self._out.writeln("WARNING: Existing binary found, overwriting")
+        pb.upload_content(parsed_args.dir_path)
 
-    def remove(self, *args):
-        parser = argparse.ArgumentParser(prog="pacco binary remove")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __remove_parser() -> ArgumentParser:
+        parser = _new_parser("pacco binary remove")
         parser.add_argument("remote_name", help="remote name")
         parser.add_argument("registry_name", help="registry name")
         parser.add_argument("settings", help="settings for the specified registry "
                                              "(e.g. os=linux,version=2.1.0,type=debug")
-        parsed_args = parser.parse_args(args)
+        return parser
+
+    def remove(self, *args):
+        parsed_args = Binary.__remove_parser().parse_args(args)
 
         assignment = Binary.__parse_settings_args(parsed_args.settings)
-        pm = self.__rm.get_remote(parsed_args.remote_name)
+        pm = self.__remote_manager().get_remote(parsed_args.remote_name)
         pr = pm.get_package_registry(parsed_args.registry_name)
         pr.remove_package_binary(assignment)
 
-    def reassign(self, *args):
-        """
-        Change the assignment of a binary to a new one
-        """
-        parser = argparse.ArgumentParser(prog="pacco binary reassign")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __reassign_parser() -> ArgumentParser:
+        parser = _new_parser("pacco binary reassign")
         parser.add_argument("remote_name", help="remote name")
         parser.add_argument("registry_name", help="registry name")
         parser.add_argument("old_settings", help="old settings (e.g. os=linux,version=2.1.0,type=debug")
         parser.add_argument("new_settings", help="new settings (e.g. os=osx,version=2.1.1,type=debug")
-        parsed_args = parser.parse_args(args)
+        return parser
+
+    def reassign(self, *args):
+        """
+        Change the assignment of a binary to a new one
+        """
+        parsed_args = Binary.__reassign_parser().parse_args(args)
         old_assignment = Binary.__parse_settings_args(parsed_args.old_settings)
         new_assignment = Binary.__parse_settings_args(parsed_args.new_settings)
-        pm = self.__rm.get_remote(parsed_args.remote_name)
+        pm = self.__remote_manager().get_remote(parsed_args.remote_name)
         pr = pm.get_package_registry(parsed_args.registry_name)
         pr.reassign_binary(old_assignment, new_assignment)
 
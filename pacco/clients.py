@@ -1,20 +1,144 @@
 from __future__ import annotations
 
 import glob
-import io
+import html
 import logging
 import os
 import re
 import shutil
+import stat
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, TypeVar
 
-import requests
-from bs4 import BeautifulSoup
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+_DUMMY_PACCO = b'.pacco'  # content of the marker file that makes a directory exist on Nexus
+_URL_RE = re.compile(r'^https?://(\w+\.)*(\w+)(:\d+)?/(.+/)*$')
+# first cell link of every listing row, the table header uses <th> so it never matches
+_ROW_LINK_RE = re.compile(rb'<tr[^>]*>\s*<td[^>]*>\s*<a\b[^>]*>([^<]*)</a>', re.IGNORECASE)
+_DEFAULT_NEXUS_PARALLELISM = 16
+
+
+def _read_nexus_parallelism() -> int:
+    value = os.environ.get('PACCO_NEXUS_PARALLELISM')
+    if value is None:
+        return _DEFAULT_NEXUS_PARALLELISM
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("Ignoring invalid PACCO_NEXUS_PARALLELISM %r, using %d", value, _DEFAULT_NEXUS_PARALLELISM)
+        return _DEFAULT_NEXUS_PARALLELISM
+
+
+_NEXUS_PARALLELISM = _read_nexus_parallelism()
+
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_T = TypeVar('_T')
+
+
+def _copytree(src: str, dst: str) -> None:
+    """
+    Copy the directory ``src`` into the new directory ``dst``. On Windows this is delegated to ``robocopy``, since
+    ``shutil.copytree`` pays several metadata calls per file there and is very slow on large trees. Elsewhere
+    ``shutil.copytree`` walks the tree and creates the directories, while the files are copied by a thread pool
+    so that many of them are in flight at once. As with ``shutil.copytree``, the copy carries on past a failing
+    file and all the failures are raised together afterwards as a ``shutil.Error``.
+    """
+    if os.name == 'nt' and shutil.which('robocopy'):
+        if os.path.exists(dst):
+            raise FileExistsError("Destination {} already exists".format(dst))
+        return_code = subprocess.call(['robocopy', src, dst, '/E', '/MT:16', '/NFL', '/NDL', '/NJH', '/NJS', '/NP'],
+                                      stdout=subprocess.DEVNULL)
+        if return_code >= 8:  # robocopy uses 0-7 for the different kinds of success
+            raise OSError("robocopy failed to copy {} to {}, exit code {}".format(src, dst, return_code))
+    else:
+        errors = []
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            copies = []
+            try:
+                shutil.copytree(src, dst, copy_function=lambda src_file, dst_file: copies.append(
+                    (src_file, dst_file, executor.submit(shutil.copy2, src_file, dst_file))))
+            except shutil.Error as err:
+                errors.extend(err.args[0])
+            for src_file, dst_file, copy in copies:
+                try:
+                    copy.result()
+                except OSError as why:
+                    errors.append((src_file, dst_file, str(why)))
+        # the pool creates the files after copytree has stamped their directory, so stamp the directories again
+        for src_dir, _, _ in os.walk(src, followlinks=True):
+            dst_dir = os.path.join(dst, os.path.relpath(src_dir, src))
+            try:
+                shutil.copystat(src_dir, dst_dir)
+            except OSError as why:
+                errors.append((src_dir, dst_dir, str(why)))
+        if errors:
+            raise shutil.Error(errors)
+
+
+def _chmod_retry(func: Callable[[str], None], path: str, _) -> None:
+    # read-only files cannot be removed on Windows, make them writable and try once more
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _remove_entry(entry: os.DirEntry) -> None:
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path, onerror=_chmod_retry)
+    else:
+        os.remove(entry.path)
+
+
+def _parallel(fn: Callable[[str], _T], items: Iterable[str]) -> List[_T]:
+    """
+    Call ``fn`` on every item using up to ``PACCO_NEXUS_PARALLELISM`` threads, for the network bound operations
+    where each item costs a round trip. The first exception raised by ``fn`` is propagated.
+
+    Returns:
+        the results of ``fn`` in the same order as ``items``
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(_NEXUS_PARALLELISM, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def _parse_listing(content: bytes) -> List[str]:
+    """
+    Extract the entry names from a Nexus directory browse page, directories keep their trailing slash.
+
+    Args:
+        content: the raw html of the page
+
+    Returns:
+        the unescaped entry names, without the parent directory
+
+    Examples:
+        >>> page = b'''<html><body><table>
+        ... <tr><th>Name</th><th>Last Modified</th><th>Size</th></tr>
+        ... <tr><td><a href="http://nexus/repo/">Parent Directory</a></td></tr>
+        ... <tr>
+        ...   <td><a href="http://nexus/repo/openssl/">openssl/</a></td><td>&nbsp;</td><td>&nbsp;</td>
+        ... </tr>
+        ... <tr><td><a href="http://nexus/repo/.pacco">.pacco</a></td><td>Mon Jan 06</td><td>6</td></tr>
+        ... <tr><td><a href="http://nexus/repo/a%26b/">a&amp;b/</a></td><td>&nbsp;</td><td>&nbsp;</td></tr>
+        ... </table></body></html>'''
+        >>> _parse_listing(page)
+        ['openssl/', '.pacco', 'a&b/']
+    """
+    links = _ROW_LINK_RE.findall(content)
+    return [html.unescape(link.decode('utf-8')) for link in links[1:]]  # skip parent dir
 
 
 class ClientAbstract:
-    pass
+    __slots__ = ()
 
 
 class FileBasedClientAbstract(ClientAbstract):
@@ -22,6 +146,8 @@ class FileBasedClientAbstract(ClientAbstract):
     An interface for file-based client functionality.
     Each client shall have it's own context of current directory and it must not change throughout the lifetime.
     """
+    __slots__ = ()
+
     def ls(self) -> List[str]:
         """
         List down the list of files and directories in it's directory
@@ -31,6 +157,29 @@ class FileBasedClientAbstract(ClientAbstract):
         """
         raise NotImplementedError()
 
+    def exists(self, name: str) -> bool:
+        """
+        Check whether a file or directory named ``name`` exists in it's directory. Clients that can check a
+        single entry cheaply should override this instead of listing the whole directory.
+
+        Args:
+            name: the name of the file or directory to check
+        Returns:
+            True if it exists, False otherwise
+        """
+        return name in self.ls()
+
+    def ls_subdirs(self) -> Dict[str, List[str]]:
+        """
+        List down the directories in it's directory together with the directories inside each of them, so that
+        callers walking two levels deep do not need to dispatch a client and list every child separately. Clients
+        that can list both levels cheaply should override this instead of dispatching a client per directory.
+
+        Returns:
+            mapping of each directory name to the list of directory names inside it
+        """
+        return {name: self.dispatch_subdir(name).ls() for name in self.ls()}
+
     def rmdir(self, name: str) -> None:
         """
         Remove a directory recursively. The ``name`` directory must be inside
@@ -86,136 +235,197 @@ class LocalClient(FileBasedClientAbstract):
     """
     An implementation of ``FileBasedClientAbstract``, using ``homepath/.pacco`` as the file storage.
     """
+    __slots__ = ('__root_dir', '__bin_dir')
+
     def __init__(self, path: Optional[str] = "", clean: Optional[bool] = False) -> None:
-        if path:
-            self.__root_dir = path
-            os.makedirs(self.__root_dir, exist_ok=True)
-        else:
-            self.__root_dir = os.path.join(str(Path.home()), '.pacco')
-            os.makedirs(self.__root_dir, exist_ok=True)
+        self.__root_dir = path if path else os.path.join(str(Path.home()), '.pacco')
         self.__bin_dir = os.path.join(self.__root_dir, 'bin')
 
         if clean:
-            self.rmdir(self.__root_dir)
+            self.__clean()
+        else:
+            os.makedirs(self.__root_dir, exist_ok=True)
+
+    def __clean(self) -> None:
+        # empty the root in place instead of removing and recreating it, the entries are removed concurrently
+        try:
+            with os.scandir(self.__root_dir) as scanned:
+                entries = list(scanned)
+        except FileNotFoundError:
             os.makedirs(self.__root_dir)
+            return
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            list(executor.map(_remove_entry, entries))
 
     def ls(self) -> List[str]:
-        return os.listdir(self.__root_dir)
+        with os.scandir(self.__root_dir) as entries:
+            return [entry.name for entry in entries]
+
+    def exists(self, name: str) -> bool:
+        return os.path.lexists(os.path.join(self.__root_dir, name))
+
+    def ls_subdirs(self) -> Dict[str, List[str]]:
+        result = {}
+        with os.scandir(self.__root_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as sub_entries:
+                        result[entry.name] = [sub_entry.name for sub_entry in sub_entries if sub_entry.is_dir()]
+        return result
 
     def rmdir(self, name: str) -> None:
-        shutil.rmtree(os.path.join(self.__root_dir, name))
+        shutil.rmtree(os.path.join(self.__root_dir, name), onerror=_chmod_retry)
 
     def mkdir(self, name: str) -> None:
-        os.makedirs(os.path.join(self.__root_dir, name))
+        path = os.path.join(self.__root_dir, name)
+        try:
+            os.mkdir(path)  # the common case, a direct child of an existing root costs a single call
+        except FileNotFoundError:  # the root was removed since __init__, or the name spans several levels
+            os.makedirs(path)
 
     def dispatch_subdir(self, name: str) -> LocalClient:
         return LocalClient(os.path.join(self.__root_dir, name))
 
     def download_dir(self, download_path: str) -> None:
         os.makedirs(download_path, exist_ok=True)
-        for file_name in glob.iglob(os.path.join(self.__bin_dir, '*')):
-            logging.info("Downloading file/folder {}".format(file_name))
-            if os.path.isdir(file_name):
-                shutil.copytree(file_name, os.path.join(download_path, os.path.relpath(file_name, self.__bin_dir)))
-            else:
-                shutil.copy(file_name, os.path.join(download_path, os.path.relpath(file_name, self.__bin_dir)))
+        try:
+            entries = os.scandir(self.__bin_dir)
+        except FileNotFoundError:  # nothing uploaded yet
+            return
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):  # hidden entries are not downloaded
+                    continue
+                logger.info("Downloading file/folder %s", entry.path)
+                if entry.is_dir():
+                    _copytree(entry.path, os.path.join(download_path, entry.name))
+                else:
+                    shutil.copy(entry.path, os.path.join(download_path, entry.name))
 
     def upload_dir(self, dir_path: str) -> None:
         shutil.rmtree(self.__bin_dir, ignore_errors=True)
-        shutil.copytree(dir_path, self.__bin_dir)
+        _copytree(dir_path, self.__bin_dir)
 
 
 class NexusFileClient(FileBasedClientAbstract):
     """
     An implementation of ``FileBasedClientAbstract``, using Nexus site repository as the file storage.
+
+    All the clients dispatched from one another share the same ``requests.Session``, so the connections to the
+    server are kept alive and reused instead of being opened for every request. The session, and its pooled
+    connections, lives as long as any client still refers to it.
     """
-    def __init__(self, url: str, username: str, password: str, clean: Optional[bool] = False) -> None:
-        if not re.match(r'^https?://(\w+\.)*(\w+)(:\d+)?/(.+/)*$', url):
+    __slots__ = ('__url', '__username', '__password', '__bin_dir', '__session')
+
+    def __init__(self, url: str, username: str, password: str, clean: Optional[bool] = False,
+                 session: Optional[requests.Session] = None) -> None:
+        if not _URL_RE.match(url):
             raise ValueError("URL {} not valid, make sure you have trailing slash".format(url))
         self.__url = url
         self.__username = username
         self.__password = password
-        self.__dummy_stream = io.StringIO(".pacco")
-
-        resp = requests.post(url+".pacco", auth=(self.__username, self.__password), data=self.__dummy_stream)
-        if resp.status_code not in [200, 201, 204]:
-            raise ConnectionError("Connection seems failed, HTTP status code {}".format(resp.status_code))
         self.__bin_dir = url + 'bin/'
 
+        if session is not None:  # dispatched from an existing client, the connection is already verified
+            self.__session = session
+        else:
+            self.__session = NexusFileClient.__new_session(username, password)
+            resp = self.__session.post(url+".pacco", data=_DUMMY_PACCO)
+            if resp.status_code not in [200, 201, 204]:
+                raise ConnectionError("Connection seems failed, HTTP status code {}".format(resp.status_code))
+
         if clean:
-            files_and_dirs = self.__ls_unformatted()
-            for name in files_and_dirs:
-                self.__rm(name)
+            _parallel(self.__rm, self.__ls_unformatted())
+
+    @staticmethod
+    def __new_session(username: str, password: str) -> requests.Session:
+        # imported here so that local-only usage never pays for loading requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.auth = (username, password)
+        # every worker of _parallel may hold a connection at once, a smaller pool would drop them
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=_NEXUS_PARALLELISM,
+                              max_retries=Retry(total=3, backoff_factor=0.2))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     @staticmethod
     def __validate_status_code(received: int, expected: List[int]) -> None:
         if received not in expected:
             raise ValueError("Receiving http status {}, expecting one of {}".format(received, expected))
 
-    def __ls_unformatted(self, path: Optional[str] = "") -> List[str]:
-        if path and path[:-1] != "/":
+    def __ls_unformatted(self, path: Optional[str] = "", missing_ok: bool = False) -> List[str]:
+        if path and not path.endswith("/"):
             path += "/"
-        resp = requests.get(self.__url + path, auth=(self.__username, self.__password))
+        resp = self.__session.get(self.__url + path)
+        if missing_ok and resp.status_code == 404:
+            return []
         NexusFileClient.__validate_status_code(resp.status_code, [200])
-        soup = BeautifulSoup(resp.content, 'html.parser')
-        content = [str(tr.td.a.text) for tr in soup.find_all('tr')[2:]]  # skip table header and parent dir
-        return content
+        return _parse_listing(resp.content)
 
     def ls(self) -> List[str]:
-        return [dir_name[:-1] for dir_name in self.__ls_unformatted()]  # remove trailing space for dir name
+        # only directories carry the trailing slash, and the .pacco marker is how Nexus keeps a directory alive
+        return [name.rstrip('/') for name in self.__ls_unformatted() if name != '.pacco']
+
+    def ls_subdirs(self) -> Dict[str, List[str]]:
+        dir_names = [dir_name for dir_name in self.__ls_unformatted() if dir_name.endswith('/')]
+        sub_listings = _parallel(self.__ls_unformatted, dir_names)  # one GET per directory, issued concurrently
+        return {dir_name[:-1]: [sub_dir_name[:-1] for sub_dir_name in sub_listing if sub_dir_name.endswith('/')]
+                for dir_name, sub_listing in zip(dir_names, sub_listings)}
 
     def rmdir(self, name: str) -> None:
         self.__rm(name+'/')
 
     def __rm(self, name: str) -> None:
-        resp = requests.delete(self.__url + name, auth=(self.__username, self.__password))
+        resp = self.__session.delete(self.__url + name)
         NexusFileClient.__validate_status_code(resp.status_code, [200, 204])
 
     def mkdir(self, name: str) -> None:
-        resp = requests.post(self.__url+name+"/.pacco", auth=(self.__username, self.__password),
-                             data=self.__dummy_stream)
+        resp = self.__session.post(self.__url+name+"/.pacco", data=_DUMMY_PACCO)
         NexusFileClient.__validate_status_code(resp.status_code, [200, 201])
 
     def dispatch_subdir(self, name: str) -> NexusFileClient:
-        return NexusFileClient(self.__url+name+'/', self.__username, self.__password)
+        return NexusFileClient(self.__url+name+'/', self.__username, self.__password, session=self.__session)
 
     def download_dir(self, download_path: str) -> None:
-        self.dispatch_subdir('bin').__download_dir(download_path)
+        # bin/ is only created by upload_dir, a binary that was never uploaded downloads as empty like LocalClient
+        self.dispatch_subdir('bin').__download_dir(download_path, missing_ok=True)
 
-    def __download_dir(self, download_path: str) -> None:
-        dirs_and_files = self.__ls_unformatted()
+    def __download_dir(self, download_path: str, missing_ok: bool = False) -> None:
+        dirs_and_files = self.__ls_unformatted(missing_ok=missing_ok)
         os.makedirs(download_path, exist_ok=True)
-        file_names = [name for name in dirs_and_files if name[-1] != '/']
+        file_names = [name for name in dirs_and_files if name[-1] != '/' and name != '.pacco']  # same rule as ls
         dir_names = [name for name in dirs_and_files if name[-1] == '/']
-        for file_name in file_names:
-            resp = requests.get(self.__url+file_name, auth=(self.__username, self.__password))
+        _parallel(lambda file_name: self.__download_file(file_name, download_path), file_names)
+        for dir_name in dir_names:
+            child_object = NexusFileClient(self.__url+dir_name, self.__username, self.__password,
+                                           session=self.__session)
+            child_object.__download_dir(os.path.join(download_path, dir_name))
+
+    def __download_file(self, file_name: str, download_path: str) -> None:
+        # streamed straight to disk, binaries can be large and are usually compressed already
+        with self.__session.get(self.__url+file_name, stream=True, headers={'Accept-Encoding': 'identity'}) as resp:
             NexusFileClient.__validate_status_code(resp.status_code, [200])
-            logging.info("Downloading file {}".format(file_name))
+            logger.info("Downloading file %s", file_name)
+            resp.raw.decode_content = True
             with open(os.path.join(download_path, file_name), 'wb') as f:
-                f.write(resp.content)
-        for dir_name in dir_names:
-            child_object = NexusFileClient(self.__url+dir_name, self.__username, self.__password)
-            child_object.download_dir(os.path.join(download_path, dir_name))
+                shutil.copyfileobj(resp.raw, f, 1 << 20)
 
     def upload_dir(self, dir_path: str) -> None:
-        if dir_path[:-1] != '/':
-            dir_path += '/'
-
-        if 'bin' in self.__ls_unformatted():
-            self.rmdir('bin')
+        resp = self.__session.delete(self.__bin_dir)  # 404 when nothing was uploaded yet, no need to list first
+        NexusFileClient.__validate_status_code(resp.status_code, [200, 204, 404])
         self.mkdir('bin')
 
-        prev_path = os.getcwd()
-        os.chdir(dir_path)
-        try:
-            for file_name in glob.iglob('**/*', recursive=True):
-                if os.path.isdir(file_name):
-                    continue
-                logging.info("Uploading file {}".format(file_name))
-                with open(file_name, 'rb') as f:
-                    resp = requests.post(self.__bin_dir + file_name, data=f, auth=(self.__username, self.__password))
-                NexusFileClient.__validate_status_code(resp.status_code, [200, 201])
-        except Exception as e:
-            raise e
-        finally:
-            os.chdir(prev_path)
+        pattern = os.path.join(glob.escape(dir_path), '**', '*')
+        file_paths = [file_path for file_path in glob.iglob(pattern, recursive=True) if not os.path.isdir(file_path)]
+        _parallel(lambda file_path: self.__upload_file(file_path, os.path.relpath(file_path, dir_path)), file_paths)
+
+    def __upload_file(self, file_path: str, file_name: str) -> None:
+        logger.info("Uploading file %s", file_name)
+        with open(file_path, 'rb') as f:
+            resp = self.__session.post(self.__bin_dir + file_name.replace(os.sep, '/'), data=f)
+        NexusFileClient.__validate_status_code(resp.status_code, [200, 201])
@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import yaml
+try:
+    from yaml import CLoader as Loader, CDumper as Dumper
+except ImportError:
+    from yaml import Loader, Dumper
 
 from pacco.classes_interface import PackageManager
 from pacco.classes_file_based import PackageManagerFileBased
@@ -53,13 +57,14 @@ class RemoteManager:
 
     def __init__(self):
         self.__pacco_config = os.path.join(str(Path.home()), '.pacco_config')
+        self.__dirty = False
         if not os.path.exists(self.__pacco_config):
             self.remotes = {}
             self.default_remotes = []
 
         else:
             with open(self.__pacco_config, "r") as f:
-                pacco_config = yaml.load(f, Loader=yaml.Loader)
+                pacco_config = yaml.load(f, Loader=Loader)
 
             remotes_serialized = pacco_config['remotes']
             default_remotes = pacco_config['default']
@@ -71,16 +76,19 @@ class RemoteManager:
             self.default_remotes = default_remotes
 
     def __del__(self):
-        self.save()
+        if self.__dirty:
+            self.save()
 
     def save(self) -> None:
         """
         Save the current state to ".pacco_config", this will also be done in the ``__del__``
-        method, such that even if you forget to save, it will be auto saved when the program closes.
+        method if there are unsaved changes, such that even if you forget to save, it will be auto saved
+        when the program closes.
         """
         serialized_remotes = {name: self.remotes[name].serialize() for name in self.remotes}
         with open(self.__pacco_config, "w") as f:
-            yaml.dump({'remotes': serialized_remotes, 'default': self.default_remotes}, stream=f)
+            yaml.dump({'remotes': serialized_remotes, 'default': self.default_remotes}, stream=f, Dumper=Dumper)
+        self.__dirty = False
 
     @staticmethod
     def __instantiate_remote(name: str, serialized):
@@ -102,9 +110,10 @@ class RemoteManager:
         Return:
             the package manager object
         """
-        if name not in self.remotes:
+        remote = self.remotes.get(name)
+        if remote is None:
             raise KeyError("The remote named {} is not found".format(name))
-        return self.remotes[name].package_manager
+        return remote.package_manager
 
     def list_remote(self) -> List[str]:
         """
@@ -139,6 +148,7 @@ class RemoteManager:
         if name in self.list_remote():
             raise NameError("The remote with name {} already exists".format(name))
         self.remotes[name] = RemoteManager.__instantiate_remote(name, configuration)
+        self.__dirty = True
 
     def remove_remote(self, name: str) -> None:
         """
@@ -152,6 +162,7 @@ class RemoteManager:
         if name not in self.remotes:
             raise KeyError("The remote {} is not registered".format(name))
         del self.remotes[name]
+        self.__dirty = True
 
     def get_default(self) -> List[str]:
         """
@@ -175,6 +186,7 @@ class RemoteManager:
             if remote not in self.remotes:
                 raise KeyError("remote {} does not exist".format(remote))
         self.default_remotes = remotes
+        self.__dirty = True
 
     def default_download(self, package_name: str, assignment: Dict[str, str], dir_path: str) -> None:
         """
@@ -219,15 +231,16 @@ class RemoteManager:
         """
         for remote_name in self.default_remotes:
             remote = self.get_remote(remote_name)
-            if package_name in remote.list_package_registries():
-                pr = remote.get_package_registry(package_name)
-                try:
-                    pb = pr.get_package_binary(assignment)
-                except (KeyError, FileNotFoundError):
-                    continue
-                else:
-                    pb.download_content(dir_path)
-                    return
+            if not remote.client.exists(package_name):
+                continue
+            pr = remote.get_package_registry(package_name)  # a registry that is not properly set must surface
+            try:
+                pb = pr.get_package_binary(assignment)
+            except (KeyError, FileNotFoundError):
+                continue
+            else:
+                pb.download_content(dir_path)
+                return
         raise FileNotFoundError("Such binary does not exist in any remotes in the default remote list")
 
 
@@ -28,7 +28,6 @@ setup(
     },
     install_requires=[
         'requests',
-        'beautifulsoup4',
         'PyYAML',
     ],
     python_requires='>=3.7',
@@ -135,6 +135,34 @@
   rm -rf local_remote_path
 }
 
+@test "pacco binary download default" {
+  echo 'local_remote_path' | pacco remote add local_remote local
+  pacco registry add local_remote openssl os,version,obfuscation
+  mkdir openssl_upload_dir && touch openssl_upload_dir/sample.a
+  pacco binary upload local_remote openssl openssl_upload_dir os=android,version=2.1.0,obfuscation=obfuscated
+  pacco remote set_default local_remote
+  pacco binary download default openssl openssl_download_dir os=android,version=2.1.0,obfuscation=obfuscated
+  result="$(ls openssl_download_dir)"
+  [ "${result}" == "sample.a" ]
+  pacco remote set_default
+  pacco binary remove local_remote openssl os=android,version=2.1.0,obfuscation=obfuscated
+  rm -rf openssl_download_dir openssl_upload_dir
+  pacco registry remove local_remote openssl
+  pacco remote remove local_remote
+  rm -rf local_remote_path
+}
+
+@test "pacco binary download malformed settings" {
+  echo 'local_remote_path' | pacco remote add local_remote local
+  pacco registry add local_remote openssl os,version,obfuscation
+  run pacco binary download local_remote openssl openssl_download_dir os=,a=b
+  [ "${status}" -ne 0 ]
+  [[ "${output}" == *"ValueError: The settings configuration must be in the form of key=value"* ]]
+  pacco registry remove local_remote openssl
+  pacco remote remove local_remote
+  rm -rf local_remote_path
+}
+
 @test "pacco binary remove" {
   echo 'local_remote_path' | pacco remote add local_remote local
   pacco registry add local_remote openssl os,version,obfuscation